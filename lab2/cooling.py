@@ -0,0 +1,123 @@
+"""
+Fuzzy AC controller for the Streamlit app: universes, membership functions and
+the compiled cooling evaluator. Kept out of main.py so that it is built once per
+process instead of on every Streamlit rerun.
+"""
+import numpy as np
+from numba import njit
+
+def _trap(u, a, b, c, d):
+    """Trapezoidal membership function evaluated over the whole universe at once"""
+    # Vertical shoulders (a == b or c == d) are handled per parameter, not per sample
+    rise = (u >= a).astype(u.dtype) if b == a else (u - a) / (b - a)
+    fall = (u <= d).astype(u.dtype) if d == c else (d - u) / (d - c)
+    return np.clip(np.minimum(rise, fall), 0.0, 1.0)
+
+def _tri(u, a, b, c):
+    """Triangular membership function evaluated over the whole universe at once"""
+    return _trap(u, a, b, b, c)
+
+# Universes and membership functions, built once at import. They are kept in
+# single precision, which halves what is sent to Plotly. The error and error_dot
+# memberships are also the controller's fuzzification tables (_ERROR_MF_TABLE,
+# _ERROR_DOT_MF_TABLE), so their float32 rounding reaches the cooling output.
+UNIVERSES = {
+    'error': np.arange(-10, 11, 0.1).astype(np.float32),
+    'error_dot': np.arange(-15, 16, 0.1).astype(np.float32),
+    'cooling': np.arange(0, 1.01, 0.01).astype(np.float32),
+}
+MEMBERSHIP_FUNCTIONS = {
+    'error': {
+        'negative': _trap(UNIVERSES['error'], -10, -10, -4, 0),
+        'zero': _tri(UNIVERSES['error'], -2, 0, 2),
+        'positive': _trap(UNIVERSES['error'], 0, 4, 10, 10),
+    },
+    'error_dot': {
+        'negative': _trap(UNIVERSES['error_dot'], -15, -15, -10, 0),
+        'zero': _tri(UNIVERSES['error_dot'], -5, 0, 5),
+        'positive': _trap(UNIVERSES['error_dot'], 0, 10, 15, 15),
+    },
+    'cooling': {
+        'off': _trap(UNIVERSES['cooling'], 0, 0, 0.3, 0.5),
+        'on': _trap(UNIVERSES['cooling'], 0.5, 0.7, 1, 1),
+    },
+}
+
+# Per variable: (universe, membership functions stacked one row per term, term labels)
+MF_CACHE = {
+    var_name: (UNIVERSES[var_name], np.stack(list(terms.values())), list(terms))
+    for var_name, terms in MEMBERSHIP_FUNCTIONS.items()
+}
+
+# Fuzzification lookup tables, one row per term (negative, zero, positive) and
+# one column per universe sample (every 0.1 from -10 and -15 respectively)
+_ERROR_MF_TABLE = MF_CACHE['error'][1]
+_ERROR_DOT_MF_TABLE = MF_CACHE['error_dot'][1]
+
+def _clipped_trap_coefficients(a, b, c, d):
+    """
+    Polynomial coefficients of the trapezoid [a, b, c, d] clipped at height h:
+        area(h)   = A1*h + A2*h**2
+        moment(h) = M1*h + M2*h**2 + M3*h**3
+    Returned as (A1, A2, M1, M2, M3).
+    """
+    rise, fall = b - a, d - c
+    return (
+        d - a,
+        -(rise + fall) / 2.0,
+        (d * d - a * a) / 2.0,
+        -(a * rise + d * fall) / 2.0,
+        (fall * fall - rise * rise) / 6.0,
+    )
+
+# Cooling output sets, integrated symbolically once
+_COOLING_OFF_COEFFS = _clipped_trap_coefficients(0.0, 0.0, 0.3, 0.5)
+_COOLING_ON_COEFFS = _clipped_trap_coefficients(0.5, 0.7, 1.0, 1.0)
+
+@njit(cache=True, fastmath=True)
+def _clipped_area_moment(h, coeffs):
+    """Area and first moment of a clipped output set, from its coefficients"""
+    a1, a2, m1, m2, m3 = coeffs
+    return h * (a1 + h * a2), h * (m1 + h * (m2 + h * m3))
+
+@njit(cache=True, fastmath=True)
+def compute_cooling(err, err_dot):
+    """
+    Evaluate the AC fuzzy controller and return the defuzzified cooling output.
+    Uses the membership functions in MF_CACHE, with Mamdani (min/max)
+    inference and centroid defuzzification done in closed form.
+    Inputs are resolved to the 0.1 spacing of the input universes.
+    """
+    # Saturate inputs at the outer edges of the membership functions. Unlike
+    # skfuzzy, which clips to the universe ends (10.9 and 15.9) where the
+    # 'positive' terms read 0, large errors keep the outer terms fully active
+    err = min(max(err, -10.0), 10.0)
+    err_dot = min(max(err_dot, -15.0), 15.0)
+    
+    # Fuzzification: snap to the nearest universe sample and read the tables
+    # (the clipped inputs always land inside them)
+    i = int((err + 10.0) * 10.0 + 0.5)
+    j = int((err_dot + 15.0) * 10.0 + 0.5)
+    err_negative = _ERROR_MF_TABLE[0, i]
+    err_zero = _ERROR_MF_TABLE[1, i]
+    err_positive = _ERROR_MF_TABLE[2, i]
+    err_dot_negative = _ERROR_DOT_MF_TABLE[0, j]
+    err_dot_positive = _ERROR_DOT_MF_TABLE[2, j]
+    
+    # Rule evaluation, rules sharing a consequent are aggregated with max
+    cooling_on = max(err_negative, err_dot_positive)              # rules 1, 4
+    cooling_off = max(err_zero, max(err_positive, err_dot_negative))  # rules 2, 3, 5
+    
+    # Centroid of the clipped output sets ('off' and 'on' only touch at 0.5,
+    # so the centroid of their union is the pooled centroid of both parts)
+    off_area, off_moment = _clipped_area_moment(cooling_off, _COOLING_OFF_COEFFS)
+    on_area, on_moment = _clipped_area_moment(cooling_on, _COOLING_ON_COEFFS)
+    
+    area = off_area + on_area
+    if area <= 0.0:
+        return 0.0
+    return (off_moment + on_moment) / area
+
+# Compile (or load from numba's cache) once per process. Streamlit re-executes
+# main.py on every rerun, but this module is imported once and stays cached
+compute_cooling(0.0, 0.0)
@@ -3,8 +3,8 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import skfuzzy as fuzz
-from skfuzzy import control as ctrl
+from cooling import MF_CACHE, compute_cooling
+from collections import deque
 from datetime import datetime
 import time
 import threading
@@ -16,50 +16,28 @@ st.set_page_config(
     layout="wide"
 )
 
+# Simulation results are stored as one preallocated array per field
+MAX_SIMULATION_STEPS = 500
+SIMULATION_FIELDS = ('time', 'temperature', 'target', 'error', 'error_dot', 'cooling_output')
+STEPS_PER_FRAME = 10  # Simulation steps advanced per page rerun
+MAX_HISTORY = 1000  # Manual readings kept (oldest are dropped)
+
 # Initialize session state
 if 'history' not in st.session_state:
-    st.session_state.history = []
+    st.session_state.history = deque(maxlen=MAX_HISTORY)
 if 'simulation_running' not in st.session_state:
     st.session_state.simulation_running = False
-if 'simulation_data' not in st.session_state:
-    st.session_state.simulation_data = []
+if 'sim_arrays' not in st.session_state:
+    st.session_state.sim_arrays = {
+        field: np.empty(MAX_SIMULATION_STEPS, dtype=np.float32) for field in SIMULATION_FIELDS
+    }
+if 'sim_len' not in st.session_state:
+    st.session_state.sim_len = 0
+if 'latest' not in st.session_state:
+    st.session_state.latest = None
 if 'current_sim_temp' not in st.session_state:
     st.session_state.current_sim_temp = 75.0
 
-def create_fuzzy_system():
-    """Create the fuzzy logic control system"""
-    # Define input and output variables
-    error = ctrl.Antecedent(np.arange(-10, 11, 0.1), 'error')
-    error_dot = ctrl.Antecedent(np.arange(-15, 16, 0.1), 'error_dot')
-    cooling = ctrl.Consequent(np.arange(0, 1.01, 0.01), 'cooling')
-    
-    # Define membership functions for error
-    error['negative'] = fuzz.trapmf(error.universe, [-10, -10, -4, 0])
-    error['zero'] = fuzz.trimf(error.universe, [-2, 0, 2])
-    error['positive'] = fuzz.trapmf(error.universe, [0, 4, 10, 10])
-    
-    # Define membership functions for error_dot
-    error_dot['negative'] = fuzz.trapmf(error_dot.universe, [-15, -15, -10, 0])
-    error_dot['zero'] = fuzz.trimf(error_dot.universe, [-5, 0, 5])
-    error_dot['positive'] = fuzz.trapmf(error_dot.universe, [0, 10, 15, 15])
-    
-    # Define membership functions for cooling output
-    cooling['off'] = fuzz.trapmf(cooling.universe, [0, 0, 0.3, 0.5])
-    cooling['on'] = fuzz.trapmf(cooling.universe, [0.5, 0.7, 1, 1])
-    
-    # Define fuzzy rules
-    rule1 = ctrl.Rule(error['negative'], cooling['on'])  # Too hot -> cooling on
-    rule2 = ctrl.Rule(error['zero'], cooling['off'])     # Perfect -> cooling off
-    rule3 = ctrl.Rule(error['positive'], cooling['off']) # Too cold -> cooling off
-    rule4 = ctrl.Rule(error_dot['positive'], cooling['on'])  # Getting hotter -> cooling on
-    rule5 = ctrl.Rule(error_dot['negative'], cooling['off']) # Getting colder -> cooling off
-    
-    # Create control system
-    cooling_ctrl = ctrl.ControlSystem([rule1, rule2, rule3, rule4, rule5])
-    cooling_sim = ctrl.ControlSystemSimulation(cooling_ctrl)
-    
-    return cooling_sim, error, error_dot, cooling
-
 def simulate_temperature_response(current_temp, target_temp, cooling_output, dt=0.1, room_thermal_mass=0.1):
     """
     Simulate how the room temperature changes based on cooling output
@@ -96,28 +74,23 @@ def calculate_error_dot(current_error, history=None):
     previous_error = history[-1]['error']
     return previous_error - current_error
 
-def run_simulation_step(target_temp, cooling_sim, thermal_mass, dt):
+def run_simulation_step(target_temp, thermal_mass, dt):
     """Run one step of the simulation"""
     current_temp = st.session_state.current_sim_temp
     
     # Calculate error and error_dot
     current_error = target_temp - current_temp
     
-    # Use simulation data for error_dot if available
-    if len(st.session_state.simulation_data) > 0:
-        prev_error = st.session_state.simulation_data[-1]['error']
+    # Use the previous step for error_dot if available
+    n = st.session_state.sim_len
+    if st.session_state.latest is not None:
+        prev_error = st.session_state.latest['error']
         current_error_dot = (prev_error - current_error) / dt
     else:
         current_error_dot = 0.0
     
     # Get fuzzy system output
-    try:
-        cooling_sim.input['error'] = current_error
-        cooling_sim.input['error_dot'] = current_error_dot
-        cooling_sim.compute()
-        cooling_output = cooling_sim.output['cooling']
-    except:
-        cooling_output = 0.0
+    cooling_output = compute_cooling(current_error, current_error_dot)
     
     # Simulate temperature response
     new_temp = simulate_temperature_response(
@@ -129,7 +102,7 @@ def run_simulation_step(target_temp, cooling_sim, thermal_mass, dt):
     
     # Store simulation data
     sim_data = {
-        'time': len(st.session_state.simulation_data) * dt,
+        'time': n * dt,
         'temperature': new_temp,
         'target': target_temp,
         'error': current_error,
@@ -138,39 +111,52 @@ def run_simulation_step(target_temp, cooling_sim, thermal_mass, dt):
         'cooling_status': 'ON' if cooling_output > 0.5 else 'OFF'
     }
     
-    st.session_state.simulation_data.append(sim_data)
+    arrays = st.session_state.sim_arrays
+    for field in SIMULATION_FIELDS:
+        arrays[field][n] = sim_data[field]
+    st.session_state.sim_len = n + 1
+    st.session_state.latest = sim_data
     
     return sim_data
 
-def plot_membership_functions(fuzzy_var, current_value, title):
+def get_simulation_arrays():
+    """Views of the recorded part of each simulation array"""
+    n = st.session_state.sim_len
+    return {field: arr[:n] for field, arr in st.session_state.sim_arrays.items()}
+
+def reset_simulation_data():
+    """Discard the recorded simulation steps (the arrays are reused)"""
+    st.session_state.sim_len = 0
+    st.session_state.latest = None
+
+# Line colors for membership function terms
+_TERM_COLORS = {'negative': '#e74c3c', 'zero': '#27ae60', 'positive': '#3498db',
+                'off': '#3498db', 'on': '#e74c3c'}
+
+def plot_membership_functions(var_name, current_value, title):
     """Plot membership functions for a fuzzy variable"""
+    universe, mfs, labels = MF_CACHE[var_name]
     fig = go.Figure()
     
-    colors = {'negative': '#e74c3c', 'zero': '#27ae60', 'positive': '#3498db',
-              'off': '#3498db', 'on': '#e74c3c'}
-    
-    for label in fuzzy_var.terms:
-        mf = fuzzy_var[label].mf
-        fig.add_trace(go.Scatter(
-            x=fuzzy_var.universe,
+    fig.add_traces([
+        go.Scatter(
+            x=universe,
             y=mf,
             mode='lines',
             name=label.title(),
-            line=dict(color=colors.get(label, '#2c3e50'), width=3)
-        ))
-    
-    # Add current value line
-    fig.add_vline(
-        x=current_value,
-        line_dash="dash",
-        line_color="#f39c12",
-        line_width=4,
-        annotation_text="Current Value"
-    )
+            line=dict(color=_TERM_COLORS.get(label, '#2c3e50'), width=3)
+        )
+        for label, mf in zip(labels, mfs)
+    ])
     
+    # Current value line, passed straight to the layout
     fig.update_layout(
+        shapes=[dict(type='line', xref='x', yref='y domain', x0=current_value, x1=current_value, y0=0, y1=1,
+                     line=dict(dash='dash', color='#f39c12', width=4))],
+        annotations=[dict(xref='x', yref='y domain', x=current_value, y=1, text="Current Value",
+                          showarrow=False, xanchor='left', yanchor='top')],
         title=title,
-        xaxis_title=fuzzy_var.label.title(),
+        xaxis_title=var_name.title(),
         yaxis_title="Membership Degree",
         yaxis=dict(range=[0, 1.1]),
         height=400,
@@ -179,31 +165,29 @@ def plot_membership_functions(fuzzy_var, current_value, title):
     
     return fig
 
-def plot_output(cooling_var, cooling_output):
+def plot_output(cooling_output):
     """Plot the fuzzy output and defuzzification"""
+    universe, mfs, labels = MF_CACHE['cooling']
     fig = go.Figure()
     
     # Plot membership functions
-    for label in cooling_var.terms:
-        mf = cooling_var[label].mf
-        fig.add_trace(go.Scatter(
-            x=cooling_var.universe,
+    fig.add_traces([
+        go.Scatter(
+            x=universe,
             y=mf,
             mode='lines',
             name=f'Cooling {label.upper()}',
             line=dict(width=2)
-        ))
-    
-    # Add defuzzified output line
-    fig.add_vline(
-        x=cooling_output,
-        line_dash="dash",
-        line_color="#8e44ad",
-        line_width=4,
-        annotation_text=f"Output: {cooling_output:.3f}"
-    )
+        )
+        for label, mf in zip(labels, mfs)
+    ])
     
+    # Defuzzified output line, passed straight to the layout
     fig.update_layout(
+        shapes=[dict(type='line', xref='x', yref='y domain', x0=cooling_output, x1=cooling_output, y0=0, y1=1,
+                     line=dict(dash='dash', color='#8e44ad', width=4))],
+        annotations=[dict(xref='x', yref='y domain', x=cooling_output, y=1, text=f"Output: {cooling_output:.3f}",
+                          showarrow=False, xanchor='left', yanchor='top')],
         title="Fuzzy Output and Defuzzification",
         xaxis_title="Cooling Output",
         yaxis_title="Membership Degree",
@@ -214,13 +198,8 @@ def plot_output(cooling_var, cooling_output):
     
     return fig
 
-def plot_simulation_results():
-    """Plot the simulation results"""
-    if not st.session_state.simulation_data:
-        return None
-    
-    df = pd.DataFrame(st.session_state.simulation_data)
-    
+def build_simulation_figure():
+    """Create the simulation results figure with empty traces"""
     # Create subplots
     fig = make_subplots(
         rows=3, cols=1,
@@ -232,8 +211,8 @@ def plot_simulation_results():
     # Temperature plot
     fig.add_trace(
         go.Scatter(
-            x=df['time'],
-            y=df['temperature'],
+            x=[],
+            y=[],
             name='Room Temperature',
             line=dict(color='red', width=3),
             mode='lines'
@@ -243,8 +222,8 @@ def plot_simulation_results():
     
     fig.add_trace(
         go.Scatter(
-            x=df['time'],
-            y=df['target'],
+            x=[],
+            y=[],
             name='Target Temperature',
             line=dict(color='green', width=2, dash='dash'),
             mode='lines'
@@ -255,8 +234,8 @@ def plot_simulation_results():
     # Error plot
     fig.add_trace(
         go.Scatter(
-            x=df['time'],
-            y=df['error'],
+            x=[],
+            y=[],
             name='Temperature Error',
             line=dict(color='blue', width=2),
             mode='lines',
@@ -265,14 +244,11 @@ def plot_simulation_results():
         row=2, col=1
     )
     
-    # Add zero line for error
-    fig.add_hline(y=0, line_dash="dot", line_color="gray", row=2, col=1)
-    
     # Cooling output plot
     fig.add_trace(
         go.Scatter(
-            x=df['time'],
-            y=df['cooling_output'],
+            x=[],
+            y=[],
             name='Cooling Output',
             line=dict(color='purple', width=2),
             mode='lines',
@@ -281,10 +257,14 @@ def plot_simulation_results():
         row=3, col=1
     )
     
-    # Add threshold line for cooling
-    fig.add_hline(y=0.5, line_dash="dot", line_color="gray", row=3, col=1)
-    
+    # Zero line for error and threshold line for cooling
     fig.update_layout(
+        shapes=[
+            dict(type='line', xref='x2 domain', yref='y2', x0=0, x1=1, y0=0, y1=0,
+                 line=dict(dash='dot', color='gray')),
+            dict(type='line', xref='x3 domain', yref='y3', x0=0, x1=1, y0=0.5, y1=0.5,
+                 line=dict(dash='dot', color='gray')),
+        ],
         height=800,
         template="plotly_white",
         title="Fuzzy Logic AC System Simulation"
@@ -297,13 +277,45 @@ def plot_simulation_results():
     
     return fig
 
+def plot_simulation_results():
+    """Plot the simulation results"""
+    if st.session_state.sim_len == 0:
+        return None
+    
+    # The layout is built once; only the trace data changes between reruns
+    if 'sim_fig' not in st.session_state:
+        st.session_state.sim_fig = build_simulation_figure()
+    fig = st.session_state.sim_fig
+    
+    sim = get_simulation_arrays()
+    for trace, field in zip(fig.data, ('temperature', 'target', 'error', 'cooling_output')):
+        trace.x = sim['time']
+        trace.y = sim[field]
+    
+    return fig
+
+def plot_simulation_live():
+    """Plot the running simulation with Streamlit's native line charts"""
+    sim = get_simulation_arrays()
+    time_index = pd.Index(sim['time'], name='Time (minutes)')
+    
+    st.line_chart(
+        pd.DataFrame({'Room Temperature': sim['temperature'], 'Target Temperature': sim['target']}, index=time_index),
+        y_label="Temperature (°F)", color=['#ff0000', '#008000'], height=300
+    )
+    st.line_chart(
+        pd.DataFrame({'Temperature Error': sim['error']}, index=time_index),
+        y_label="Error (°F)", color='#0000ff', height=200
+    )
+    st.line_chart(
+        pd.DataFrame({'Cooling Output': sim['cooling_output']}, index=time_index),
+        y_label="Cooling Output", color='#800080', height=200
+    )
+
 def main():
     st.title("🌡️ Fuzzy Logic Air Conditioning System with Simulation")
     st.markdown("---")
     
-    # Create fuzzy system
-    cooling_sim, error_var, error_dot_var, cooling_var = create_fuzzy_system()
-    
     # Sidebar controls
     st.sidebar.header("🎛️ Control Panel")
     
@@ -312,7 +324,7 @@ def main():
     
     target_temp = st.sidebar.slider(
         "Target Temperature (°F)",
-        min_value=-100.0,
+        min_value=50.0,
         max_value=85.0,
         value=72.0,
         step=0.5
@@ -320,7 +332,7 @@ def main():
     
     initial_temp = st.sidebar.slider(
         "Initial Room Temperature (°F)",
-        min_value=-100.0,
+        min_value=50.0,
         max_value=85.0,
         value=75.0,
         step=0.5
@@ -355,7 +367,7 @@ def main():
     with col1:
         if st.button("▶️ Start Simulation", type="primary"):
             st.session_state.simulation_running = True
-            st.session_state.simulation_data = []
+            reset_simulation_data()
             st.session_state.current_sim_temp = initial_temp
     
     with col2:
@@ -364,7 +376,7 @@ def main():
     
     if st.sidebar.button("🔄 Reset Simulation"):
         st.session_state.simulation_running = False
-        st.session_state.simulation_data = []
+        reset_simulation_data()
         st.session_state.current_sim_temp = initial_temp
         st.rerun()
     
@@ -412,8 +424,8 @@ def main():
     if st.session_state.simulation_running:
         with sim_placeholder.container():
             # Current simulation status
-            if st.session_state.simulation_data:
-                latest_data = st.session_state.simulation_data[-1]
+            if st.session_state.latest:
+                latest_data = st.session_state.latest
                 
                 col1, col2, col3, col4 = st.columns(4)
                 
@@ -430,10 +442,9 @@ def main():
                     cooling_status = latest_data['cooling_status']
                     st.metric("Cooling Status", cooling_status, f"{latest_data['cooling_output']:.1%}")
                 
-                # Real-time plot
-                fig = plot_simulation_results()
-                if fig:
-                    st.plotly_chart(fig, use_container_width=True)
+                # Real-time plot (native charts are cheap to redraw on every rerun,
+                # the full Plotly figure is shown in the Simulation Results tab)
+                plot_simulation_live()
                 
                 # Progress indicator
                 if abs(latest_data['error']) < 0.5:
@@ -444,8 +455,11 @@ def main():
                     st.info("🌡️ System is actively working to reach target temperature...")
             
             # Run simulation step
-            if len(st.session_state.simulation_data) < 500:  # Limit simulation length
-                sim_data = run_simulation_step(target_temp, cooling_sim, thermal_mass, dt)
+            if st.session_state.sim_len < MAX_SIMULATION_STEPS:  # Limit simulation length
+                # Advance a batch of steps, then render the page once
+                steps = min(STEPS_PER_FRAME, MAX_SIMULATION_STEPS - st.session_state.sim_len)
+                for _ in range(steps):
+                    run_simulation_step(target_temp, thermal_mass, dt)
                 time.sleep(0.1)  # Small delay for animation effect
                 st.rerun()
             else:
@@ -458,13 +472,7 @@ def main():
         current_error_dot = calculate_error_dot(current_error)
         
         # Run fuzzy logic simulation
-        try:
-            cooling_sim.input['error'] = current_error
-            cooling_sim.input['error_dot'] = current_error_dot
-            cooling_sim.compute()
-            cooling_output = cooling_sim.output['cooling']
-        except:
-            cooling_output = 0.0
+        cooling_output = compute_cooling(current_error, current_error_dot)
         
         # Display current status
         col1, col2, col3, col4 = st.columns(4)
@@ -492,20 +500,20 @@ def main():
             
             with col1:
                 error_fig = plot_membership_functions(
-                    error_var, current_error, 
+                    'error', current_error,
                     "Temperature Error Membership Functions"
                 )
                 st.plotly_chart(error_fig, use_container_width=True)
             
             with col2:
                 error_dot_fig = plot_membership_functions(
-                    error_dot_var, current_error_dot,
+                    'error_dot', current_error_dot,
                     "Error Rate Membership Functions"
                 )
                 st.plotly_chart(error_dot_fig, use_container_width=True)
         
         with tab2:
-            output_fig = plot_output(cooling_var, cooling_output)
+            output_fig = plot_output(cooling_output)
             st.plotly_chart(output_fig, use_container_width=True)
             
             # System interpretation
@@ -531,41 +539,40 @@ def main():
                 
                 # Clear history button
                 if st.button("Clear History"):
-                    st.session_state.history = []
+                    st.session_state.history.clear()
                     st.rerun()
             else:
                 st.info("No manual temperature readings yet. Add some readings using the sidebar controls!")
         
         with tab4:
-            if st.session_state.simulation_data:
+            if st.session_state.sim_len:
                 st.subheader("Latest Simulation Results")
                 fig = plot_simulation_results()
                 if fig:
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(fig, use_container_width=True, key='sim_chart')
                 
                 # Simulation statistics
-                df = pd.DataFrame(st.session_state.simulation_data)
+                sim = get_simulation_arrays()
+                error_arr = sim['error']
                 
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
-                    settling_time = None
-                    for i, row in df.iterrows():
-                        if abs(row['error']) < 0.5:
-                            settling_time = row['time']
-                            break
+                    # First step within 0.5°F of the target
+                    settled = np.abs(error_arr) < 0.5
+                    settling_time = sim['time'][settled.argmax()] if settled.any() else None
                     
-                    if settling_time:
+                    if settling_time is not None:
                         st.metric("Settling Time", f"{settling_time:.1f} min")
                     else:
                         st.metric("Settling Time", "Not reached")
                 
                 with col2:
-                    max_overshoot = df['error'].min() if df['error'].min() < 0 else 0
+                    max_overshoot = min(error_arr.min(), 0.0)
                     st.metric("Max Overshoot", f"{abs(max_overshoot):.1f}°F")
                 
                 with col3:
-                    steady_state_error = df['error'].iloc[-1] if len(df) > 0 else 0
+                    steady_state_error = error_arr[-1]
                     st.metric("Steady State Error", f"{steady_state_error:.1f}°F")
                 
             else:
@@ -1,7 +1,67 @@
 import pygame
 import random
 import math
-from collections import deque
+import numpy as np
+from numba import njit
+from collections import OrderedDict
+
+# pygame-ce exposes IS_CE and adds Surface.fblits plus SIMD alpha blitters
+_IS_CE = hasattr(pygame, 'IS_CE')
+
+# --- Fuzzy Logic Engine ---
+# Rule consequent strengths, one rule per (error, error_dot) term pair in
+# row-major order over (negative, zero, positive) x (negative, zero, positive)
+_RULE_STRENGTHS = np.array([-1.0, -0.8, -0.6, 0.8, 0.0, -0.8, 0.6, 0.8, 1.0])
+# Action code of each rule (0: NEUTRAL, 1: COOL, 2: HEAT), same order as _RULE_STRENGTHS
+_RULE_ACTION_CODES = np.array([1, 1, 1, 2, 0, 1, 2, 2, 2])
+# Trapezoid [a, b, c, d] of the (negative, zero, positive) terms of error
+# (-20 to 20) and error_dot (-2 to 2); triangles are trapezoids with b == c
+MEMBERSHIP_PARAMS = np.array([
+    [[-20.0, -20.0, -2.0, 0.0], [-2.0, 0.0, 0.0, 2.0], [0.0, 2.0, 20.0, 20.0]],
+    [[-2.0, -2.0, -0.2, 0.0], [-0.2, 0.0, 0.0, 0.2], [0.0, 0.2, 2.0, 2.0]],
+], dtype=np.float32)
+
+@njit(cache=True, fastmath=True, inline='always')
+def _trap(x, a, b, c, d):
+    """Trapezoidal membership function."""
+    if x <= a or x >= d: return 0.0
+    if b <= x <= c: return 1.0
+    if x < b: return (x - a) / (b - a)
+    return (d - x) / (d - c)
+
+@njit(cache=True, fastmath=True)
+def fuzzy_step(error, error_dot, membership_params):
+    """
+    Compiled fuzzy controller step.
+    Returns the defuzzified action strength and the action code of the
+    dominant rule (0 when no rule fires), see _RULE_ACTION_CODES.
+    """
+    # Fuzzification of both inputs with the trapezoids in membership_params
+    err_mf = np.empty(3)
+    err_dot_mf = np.empty(3)
+    for k in range(3):
+        a, b, c, d = membership_params[0, k]
+        err_mf[k] = _trap(error, a, b, c, d)
+        a, b, c, d = membership_params[1, k]
+        err_dot_mf[k] = _trap(error_dot, a, b, c, d)
+
+    # Rule evaluation (Mamdani inference using min for 'AND' logic) and
+    # defuzzification using a weighted average method
+    numerator, denominator, max_condition = 0.0, 0.0, 0.0
+    dominant = -1
+    for i in range(3):
+        for j in range(3):
+            condition = min(err_mf[i], err_dot_mf[j])
+            if condition > 0:
+                numerator += condition * _RULE_STRENGTHS[3 * i + j]
+                denominator += condition
+                if condition > max_condition:
+                    max_condition = condition
+                    dominant = 3 * i + j
+
+    output_strength = numerator / denominator if denominator > 0 else 0.0
+    action_code = _RULE_ACTION_CODES[dominant] if dominant >= 0 else 0
+    return output_strength, action_code
 
 # --- Main Application Class ---
 class FuzzyThermalControl:
@@ -9,6 +69,23 @@ class FuzzyThermalControl:
     A Pygame application that simulates a fuzzy logic-based thermal control system.
     This class handles the simulation logic, fuzzy controller, and graphical user interface.
     """
+    # Control action named by each fuzzy_step action code
+    _ACTION_NAMES = ('NEUTRAL', 'COOL', 'HEAT')
+    # Badge (background, text) colors of each control action
+    _ACTION_STYLES = {
+        'COOL': ((229, 242, 255), (37, 99, 235)),
+        'HEAT': ((254, 226, 226), (220, 38, 38)),
+        'NEUTRAL': ((243, 244, 246), (75, 85, 99)),
+    }
+    # Row labels of the metrics panel
+    _METRIC_LABELS = ("Error:", "Error Rate:", "Action Strength:", "Runtime:")
+    # Number of rendered text surfaces kept between frames
+    _TEXT_CACHE_SIZE = 256
+    # Characters of the numeric readouts, which are composed from per-character surfaces
+    _READOUT_GLYPHS = "0123456789.-:°C/s "
+    # Number of graph samples kept; the graph shows the last 60s (120 samples)
+    _HISTORY_SIZE = 200
+
     def __init__(self):
         # 1. Pygame Initialization
         pygame.init()
@@ -16,7 +93,15 @@ class FuzzyThermalControl:
 
         # Screen and Layout Dimensions
         self.WIDTH, self.HEIGHT = 1280, 720
-        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
+        # SCALED presents the frame through an SDL renderer, which also allows vsync.
+        # The renderer always presents the whole window (display.update(rects)
+        # behaves like flip), so frames are shown with flip
+        try:
+            self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error:
+            # Vsync is not available with every video driver
+            self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.SCALED | pygame.DOUBLEBUF)
+        self._screen_rect = self.screen.get_rect()
         self.clock = pygame.time.Clock()
         
         # Load fonts for rendering text
@@ -47,11 +132,23 @@ class FuzzyThermalControl:
             'btn_reset_hover': (55, 65, 81),
         }
 
+        # Thermometer fill color per whole degree from 0 to 50°C
+        self._fill_color_lut = np.empty((51, 3), dtype=np.uint8)
+        self._fill_color_lut[:15] = (59, 130, 246)
+        self._fill_color_lut[15:25] = self.COLOR['accent_green']
+        self._fill_color_lut[25:35] = (245, 158, 11)
+        self._fill_color_lut[35:] = self.COLOR['accent_red']
+
         # 2. State Variables
         self.current_temp = random.uniform(10.0, 40.0)
         self.target_temp = 25.0
         self.is_running = False
-        self.temp_history = deque(maxlen=120)  # Max 120 points (60s of data)
+        # Graph history as parallel ring buffers; _hist_head is the next write slot
+        self._hist_time = np.empty(self._HISTORY_SIZE, np.float32)
+        self._hist_temp = np.empty(self._HISTORY_SIZE, np.float32)
+        self._hist_target = np.empty(self._HISTORY_SIZE, np.float32)
+        self._hist_head = 0
+        self._hist_len = 0
         self.error = 0.0
         self.error_dot = 0.0
         self.control_action = 'NEUTRAL'
@@ -67,8 +164,37 @@ class FuzzyThermalControl:
         # Flag to track ambient drift application
         self.is_applying_ambient_drift = False
 
+        # Rendered text surfaces keyed by (text, font, color), least recently used first
+        self._text_cache = OrderedDict()
+        # (surface, position) text blits collected during a frame
+        self._frame_blit_queue = []
+        # Redraw the panels on the next frame; set whenever the displayed state changes
+        self._needs_redraw = True
+        # Set when a button hover color changed this frame
+        self._hover_dirty = False
+
         # UI Element Rectangles for layout and interaction
         self._initialize_layout()
+        # Static panel contents, rendered once
+        self._build_static_panels()
+        # Compile (or load) the fuzzy controller now rather than on the first simulation step
+        fuzzy_step(0.0, 0.0, MEMBERSHIP_PARAMS)
+        # Rounded rectangle surfaces keyed by (size, color, radius)
+        self._rounded_rect_cache = {}
+        for name in ('btn_start', 'btn_start_hover', 'btn_pause', 'btn_pause_hover'):
+            self._rounded_rect(self.btn_start_pause_rect.size, self.COLOR[name], 8)
+        for name in ('btn_reset', 'btn_reset_hover'):
+            self._rounded_rect(self.btn_reset_rect.size, self.COLOR[name], 8)
+        for bg_color, _ in self._ACTION_STYLES.values():
+            self._rounded_rect(self._action_rect.size, bg_color, 15)
+        # Readout glyph surfaces keyed by (font, color), then by character
+        self._glyph_cache = {}
+        readout_styles = [(self.font_big, self.COLOR['text'])]
+        readout_styles += [(self.font_mono, self.COLOR[name]) for name in ('accent_blue', 'accent_purple', 'accent_orange', 'accent_green')]
+        for font, color in readout_styles:
+            self._glyph_cache[font, color] = {ch: font.render(ch, True, color).convert_alpha() for ch in self._READOUT_GLYPHS}
+        # Start/pause and reset button colors, updated on mouse and button events
+        self._update_button_colors(pygame.mouse.get_pos())
 
     def _initialize_layout(self):
         """Define the Rect objects for all UI panels to structure the layout."""
@@ -86,63 +212,98 @@ class FuzzyThermalControl:
         self.btn_minus_rect = pygame.Rect(self.control_panel_rect.x + 240, self.control_panel_rect.y + 75, 40, 40)
         self.btn_ambient_toggle_rect = pygame.Rect(self.ambient_panel_rect.x + 30, self.ambient_panel_rect.y + 20, self.ambient_panel_rect.width - 60, 35)
 
-    # 3. Fuzzy Logic Engine
-    def triangular_mf(self, x, a, b, c):
-        """Triangular membership function."""
-        if x <= a or x >= c: return 0.0
-        if x == b: return 1.0
-        if x < b: return (x - a) / (b - a)
-        return (c - x) / (c - b)
-
-    def trapezoidal_mf(self, x, a, b, c, d):
-        """Trapezoidal membership function."""
-        if x <= a or x >= d: return 0.0
-        if b <= x <= c: return 1.0
-        if x < b: return (x - a) / (b - a)
-        return (d - x) / (d - c)
+        # Graph plot area, its 0-50°C grid line heights and pixels per second of history
+        self._graph_area = pygame.Rect(self.graph_panel_rect.x + 60, self.graph_panel_rect.y + 60, self.graph_panel_rect.width - 90, self.graph_panel_rect.height - 100)
+        self._graph_grid_ys = tuple(self._graph_area.bottom - (i / 50) * self._graph_area.height for i in range(0, 51, 10))
+        self._graph_time_scale = self._graph_area.width / 60.0
+        # Area of the graph panel holding the polylines (the plot area plus the line
+        # width), and the plot area relative to it
+        graph_area_local = self._graph_area.move(-self.graph_panel_rect.x, -self.graph_panel_rect.y)
+        self._graph_lines_rect = graph_area_local.inflate(4, 4)
+        self._graph_area_lines = graph_area_local.move(-self._graph_lines_rect.x, -self._graph_lines_rect.y)
+
+        # Live display columns: thermometer, current temperature and status
+        section_width = self.thermo_panel_rect.width / 3
+        self._thermo_center_x = self.thermo_panel_rect.left + section_width * 0.9
+        self._current_center_x = self.thermo_panel_rect.left + section_width * 1.3
+        self._status_center_x = self.thermo_panel_rect.left + section_width * 2.2
+        self._bulb_center = (self._thermo_center_x, self.thermo_panel_rect.centery)
+        self._thermo_stem_rect_static = (self._thermo_center_x - 15, self.thermo_panel_rect.centery - 75, 30, 75)
+        self._action_rect = pygame.Rect(0, 0, 120, 35)
+        self._action_rect.center = (self._status_center_x, self.thermo_panel_rect.centery)
+
+        # One row per entry of _METRIC_LABELS
+        self._metric_item_rects = [pygame.Rect(self.metrics_panel_rect.x + 20, self.metrics_panel_rect.y + 70 + i * 40, self.metrics_panel_rect.width - 40, 35) for i in range(len(self._METRIC_LABELS))]
+
+    def _build_static_panels(self):
+        """
+        Pre-render everything in the panels that never changes between frames
+        (frames, titles, grid, axis labels, fixed buttons) to one Surface per panel.
+        """
+        canvas = pygame.Surface((self.WIDTH, self.HEIGHT)).convert()
+        canvas.fill(self.COLOR['bg'])
+
+        # Temperature graph: frame, plot area, grid lines and axis labels
+        panel_rect = self.graph_panel_rect
+        self._draw_panel(panel_rect, "Temperature History (60s)", canvas)
+        graph_area = self._graph_area
+        pygame.draw.rect(canvas, self.COLOR['bg'], graph_area)
+        for i, y in zip(range(0, 51, 10), self._graph_grid_ys):
+            pygame.draw.line(canvas, self.COLOR['grid'], (graph_area.left, y), (graph_area.right, y))
+            self._render_and_blit_text(str(i), self.font_small, self.COLOR['text_light'], (graph_area.left - 10, y), anchor="midright", surface=canvas)
+        self._render_and_blit_text("Time (s)", self.font_small, self.COLOR['text_light'], (graph_area.centerx, graph_area.bottom + 25), anchor="center", surface=canvas)
+
+        # Live display: frame, empty thermometer and the "Current" caption
+        panel_rect = self.thermo_panel_rect
+        self._draw_panel(panel_rect, "Live Display", canvas)
+        pygame.draw.rect(canvas, self.COLOR['grid'], self._thermo_stem_rect_static, border_radius=15)
+        pygame.draw.circle(canvas, self.COLOR['grid'], self._bulb_center, 25)
+        self._render_and_blit_text("Current", self.font_small, self.COLOR['text_light'], (self._current_center_x, panel_rect.centery + 25), anchor="center", surface=canvas)
 
+        # Control panel: frame, caption and the +/- buttons
+        panel_rect = self.control_panel_rect
+        self._draw_panel(panel_rect, "Control Panel", canvas)
+        self._render_and_blit_text("Target Temperature (°C)", self.font_small, self.COLOR['text_light'], (panel_rect.x + 30, panel_rect.y + 60), surface=canvas)
+        pygame.draw.rect(canvas, self.COLOR['grid'], self.btn_plus_rect, border_radius=8)
+        self._render_and_blit_text("+", self.font_big, self.COLOR['text'], self.btn_plus_rect.center, anchor="center", surface=canvas)
+        pygame.draw.rect(canvas, self.COLOR['grid'], self.btn_minus_rect, border_radius=8)
+        self._render_and_blit_text("-", self.font_big, self.COLOR['text'], self.btn_minus_rect.center, anchor="center", surface=canvas)
+
+        # Ambient panel: frame and toggle button background
+        self._draw_panel(self.ambient_panel_rect, "", canvas)
+        pygame.draw.rect(canvas, self.COLOR['grid'], self.btn_ambient_toggle_rect, border_radius=8)
+
+        # Metrics panel: frame, row backgrounds and row labels
+        panel_rect = self.metrics_panel_rect
+        self._draw_panel(panel_rect, "System Metrics", canvas)
+        for item_rect, label in zip(self._metric_item_rects, self._METRIC_LABELS):
+            pygame.draw.rect(canvas, self.COLOR['bg'], item_rect, border_radius=8)
+            self._render_and_blit_text(label, self.font_small, self.COLOR['text'], (item_rect.left + 15, item_rect.centery), anchor="midleft", surface=canvas)
+
+        # Cut out one Surface per panel, including the drop shadow below it
+        def cut(rect):
+            return canvas.subsurface(pygame.Rect(rect.x, rect.y, rect.width, rect.height + 4)).copy()
+
+        self._graph_bg = cut(self.graph_panel_rect)
+        self._thermo_bg_static = cut(self.thermo_panel_rect)
+        self._control_bg = cut(self.control_panel_rect)
+        self._ambient_bg = cut(self.ambient_panel_rect)
+        self._metrics_bg = cut(self.metrics_panel_rect)
+
+        # Graph panel with the current polylines, rebuilt by draw_graph when _graph_dirty is set
+        self._graph_surface = self._graph_bg.copy()
+        self._graph_dirty = True
+        # Transparent layer both polylines are drawn on before compositing them onto the graph
+        self._graph_lines = pygame.Surface(self._graph_lines_rect.size, pygame.SRCALPHA).convert_alpha()
+
+    # 3. Fuzzy Logic Engine
     def fuzzy_controller(self, err, err_dot):
         """
         Core fuzzy logic controller.
         Takes error and error rate as input and returns a control action.
         """
-        # Fuzzification for error (-20 to 20)
-        err_neg = self.trapezoidal_mf(err, -20, -20, -2, 0)
-        err_zer = self.triangular_mf(err, -2, 0, 2)
-        err_pos = self.trapezoidal_mf(err, 0, 2, 20, 20)
-
-        # Fuzzification for error_dot (-2 to 2)
-        err_dot_neg = self.trapezoidal_mf(err_dot, -2, -2, -0.2, 0)
-        err_dot_zer = self.triangular_mf(err_dot, -0.2, 0, 0.2)
-        err_dot_pos = self.trapezoidal_mf(err_dot, 0, 0.2, 2, 2)
-
-        # Rule evaluation (Mamdani inference using min for 'AND' logic)
-        rules = [
-            {'condition': min(err_neg, err_dot_neg), 'action': 'COOL', 'strength': -1.0},
-            {'condition': min(err_neg, err_dot_zer), 'action': 'COOL', 'strength': -0.8},
-            {'condition': min(err_neg, err_dot_pos), 'action': 'COOL', 'strength': -0.6},
-            {'condition': min(err_zer, err_dot_neg), 'action': 'HEAT', 'strength': 0.8},
-            {'condition': min(err_zer, err_dot_zer), 'action': 'NEUTRAL','strength': 0.0},
-            {'condition': min(err_zer, err_dot_pos), 'action': 'COOL', 'strength': -0.8},
-            {'condition': min(err_pos, err_dot_neg), 'action': 'HEAT', 'strength': 0.6},
-            {'condition': min(err_pos, err_dot_zer), 'action': 'HEAT', 'strength': 0.8},
-            {'condition': min(err_pos, err_dot_pos), 'action': 'HEAT', 'strength': 1.0},
-        ]
-
-        # Defuzzification using a weighted average method
-        numerator, denominator, max_condition = 0.0, 0.0, 0.0
-        dominant_action = 'NEUTRAL'
-
-        for rule in rules:
-            if rule['condition'] > 0:
-                numerator += rule['condition'] * rule['strength']
-                denominator += rule['condition']
-                if rule['condition'] > max_condition:
-                    max_condition = rule['condition']
-                    dominant_action = rule['action']
-        
-        output_strength = numerator / denominator if denominator > 0 else 0.0
-        return {'action': dominant_action, 'strength': output_strength}
+        output_strength, action_code = fuzzy_step(err, err_dot, MEMBERSHIP_PARAMS)
+        return {'action': self._ACTION_NAMES[action_code], 'strength': output_strength}
 
     # 4. Simulation Logic
     def update_simulation(self):
@@ -197,19 +358,23 @@ class FuzzyThermalControl:
         new_temp = max(0, min(100, self.current_temp + temp_change))
         self.current_temp = new_temp
 
-        # 7. Update history for the graph
-        self.temp_history.append({
-            'time': self.time_step * 0.5,
-            'temp': self.current_temp,
-            'target': self.target_temp,
-        })
+        # 7. Update history for the graph, overwriting the oldest sample when full
+        head = self._hist_head
+        self._hist_time[head] = self.time_step * 0.5
+        self._hist_temp[head] = self.current_temp
+        self._hist_target[head] = self.target_temp
+        self._hist_head = (head + 1) % self._HISTORY_SIZE
+        self._hist_len = min(self._HISTORY_SIZE, self._hist_len + 1)
         self.time_step += 1
+        self._needs_redraw = self._graph_dirty = True
 
     def reset_simulation(self):
         """Resets the simulation to its initial state."""
         self.is_running = False
         self.current_temp = random.uniform(10.0, 40.0)
-        self.temp_history.clear()
+        self._hist_head = 0
+        self._hist_len = 0
+        self._graph_dirty = True
         self.error = 0.0
         self.error_dot = 0.0
         self.control_action = 'NEUTRAL'
@@ -220,172 +385,236 @@ class FuzzyThermalControl:
         self.is_applying_ambient_drift = False
         
     # 5. GUI Drawing Methods
-    def _draw_panel(self, rect, title):
+    def _draw_panel(self, rect, title, surface=None):
         """Helper function to draw a bordered panel with a title."""
-        pygame.draw.rect(self.screen, self.COLOR['shadow'], (rect.x, rect.y + 4, rect.width, rect.height), border_radius=12)
-        pygame.draw.rect(self.screen, self.COLOR['panel'], rect, border_radius=12)
+        surface = surface or self.screen
+        pygame.draw.rect(surface, self.COLOR['shadow'], (rect.x, rect.y + 4, rect.width, rect.height), border_radius=12)
+        pygame.draw.rect(surface, self.COLOR['panel'], rect, border_radius=12)
         
-        title_surf = self.font_medium.render(title, True, self.COLOR['text'])
-        self.screen.blit(title_surf, (rect.x + 20, rect.y + 15))
+        title_surf = self._render_text(title, self.font_medium, self.COLOR['text'])
+        surface.blit(title_surf, (rect.x + 20, rect.y + 15))
+
+    def _rounded_rect(self, size, color, radius):
+        """Returns a cached transparent surface holding a filled rounded rectangle."""
+        key = (size, color, radius)
+        surf = self._rounded_rect_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(surf, color, surf.get_rect(), border_radius=radius)
+            surf = self._rounded_rect_cache[key] = surf.convert_alpha()
+        return surf
+
+    def _render_text(self, text, font, color):
+        """Returns the rendered text Surface, re-using it if it was rendered recently."""
+        key = (text, id(font), color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+            if len(self._text_cache) > self._TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surf
 
-    def _render_and_blit_text(self, text, font, color, position, anchor="topleft"):
-        """Renders text and blits it to the screen with a specific anchor."""
-        surf = font.render(text, True, color)
+    def _render_and_blit_text(self, text, font, color, position, anchor="topleft", surface=None):
+        """
+        Renders text with a specific anchor and queues it for the screen, to be
+        drawn by _flush_blits; text entirely off screen is dropped. Text for
+        another `surface` is blitted right away.
+        """
+        surf = self._render_text(text, font, color)
         rect = surf.get_rect(**{anchor: position})
-        self.screen.blit(surf, rect)
-
-    def draw_graph(self):
-        """Draws the real-time temperature graph."""
-        panel_rect = self.graph_panel_rect
-        self._draw_panel(panel_rect, "Temperature History (60s)")
-        
-        graph_area = pygame.Rect(panel_rect.x + 60, panel_rect.y + 60, panel_rect.width - 90, panel_rect.height - 100)
-        pygame.draw.rect(self.screen, self.COLOR['bg'], graph_area)
+        if surface is None:
+            if self._screen_rect.colliderect(rect):
+                self._frame_blit_queue.append((surf, rect))
+        else:
+            surface.blit(surf, rect)
 
-        # Y-Axis (Temperature)
-        for i in range(0, 51, 10):
-            y = graph_area.bottom - (i / 50) * graph_area.height
-            pygame.draw.line(self.screen, self.COLOR['grid'], (graph_area.left, y), (graph_area.right, y))
-            self._render_and_blit_text(str(i), self.font_small, self.COLOR['text_light'], (graph_area.left - 10, y), anchor="midright")
+    def _blit_digits(self, text, font, color, position, anchor="topleft"):
+        """
+        Queues a numeric readout for the screen glyph by glyph from the glyph cache,
+        so changing values never hit the font rasterizer. Falls back to
+        _render_and_blit_text for characters or styles that were not pre-rendered.
+        """
+        try:
+            glyphs = self._glyph_cache[font, color]
+            surfs = [glyphs[ch] for ch in text]
+        except KeyError:
+            self._render_and_blit_text(text, font, color, position, anchor)
+            return
+        rect = pygame.Rect(0, 0, sum(surf.get_width() for surf in surfs), surfs[0].get_height())
+        setattr(rect, anchor, position)
+        if not self._screen_rect.colliderect(rect):
+            return
+        x, y = rect.topleft
+        for surf in surfs:
+            self._frame_blit_queue.append((surf, (x, y)))
+            x += surf.get_width()
+
+    def _flush_blits(self):
+        """Draws all queued text onto the screen in a single call."""
+        if _IS_CE:
+            self.screen.fblits(self._frame_blit_queue)
+        else:
+            self.screen.blits(self._frame_blit_queue, doreturn=False)
+        self._frame_blit_queue.clear()
+
+    def _history(self):
+        """Returns the (time, temp, target) history arrays, oldest sample first."""
+        start = self._hist_head - self._hist_len
+        arrays = (self._hist_time, self._hist_temp, self._hist_target)
+        if start >= 0:
+            return tuple(a[start:self._hist_head] for a in arrays)
+        # The valid samples wrap past the end of the buffers
+        return tuple(np.concatenate((a[start:], a[:self._hist_head])) for a in arrays)
 
-        # X-Axis (Time)
-        self._render_and_blit_text("Time (s)", self.font_small, self.COLOR['text_light'], (graph_area.centerx, graph_area.bottom + 25), anchor="center")
-        
-        if len(self.temp_history) > 1:
-            points_temp, points_target = [], []
-            max_time = self.temp_history[-1]['time']
-            min_time = max(0, max_time - 60)
-
-            for data in self.temp_history:
-                if data['time'] >= min_time:
-                    time_norm = (data['time'] - min_time) / 60
-                    x = graph_area.left + time_norm * graph_area.width
-                    
-                    temp_norm = min(1.0, max(0.0, data['temp'] / 50.0))
-                    y_temp = graph_area.bottom - temp_norm * graph_area.height
-                    points_temp.append((x, y_temp))
-
-                    target_norm = min(1.0, max(0.0, data['target'] / 50.0))
-                    y_target = graph_area.bottom - target_norm * graph_area.height
-                    points_target.append((x, y_target))
-            
-            if len(points_temp) > 1:
-                pygame.draw.lines(self.screen, self.COLOR['accent_blue'], False, points_temp, 2)
-            if len(points_target) > 1:
-                pygame.draw.lines(self.screen, self.COLOR['accent_red'], False, points_target, 2)
+    def draw_graph(self):
+        """Draws the real-time temperature graph, rebuilding it only after the history changed."""
+        if self._graph_dirty:
+            self._build_graph_surface()
+            self._graph_dirty = False
+        self.screen.blit(self._graph_surface, self.graph_panel_rect.topleft)
+
+    def _build_graph_surface(self):
+        """Redraws the history polylines over the static graph panel into the cached graph surface."""
+        surface = self._graph_surface
+        surface.blit(self._graph_bg, (0, 0))
+        graph_area = self._graph_area_lines
+
+        if self._hist_len > 1:
+            hist_time, hist_temp, hist_target = self._history()
+            min_time = hist_time[-1] - 60
+            if min_time < 0: min_time = 0
+            mask = hist_time >= min_time
+
+            x = graph_area.left + (hist_time[mask] - min_time) * self._graph_time_scale
+            y_temp = graph_area.bottom - np.clip(hist_temp[mask] / 50.0, 0.0, 1.0) * graph_area.height
+            y_target = graph_area.bottom - np.clip(hist_target[mask] / 50.0, 0.0, 1.0) * graph_area.height
+
+            if len(x) > 1:
+                # Whole-pixel coordinates, so the point lists hold small Python ints
+                x = x.astype(np.int32).tolist()
+                lines = self._graph_lines
+                lines.fill((0, 0, 0, 0))
+                pygame.draw.lines(lines, self.COLOR['accent_blue'], False, list(zip(x, y_temp.astype(np.int32).tolist())), 2)
+                pygame.draw.lines(lines, self.COLOR['accent_red'], False, list(zip(x, y_target.astype(np.int32).tolist())), 2)
+                # Opaque line pixels over fully transparent ones, so the layer is already premultiplied
+                surface.blit(lines, self._graph_lines_rect, special_flags=pygame.BLEND_PREMULTIPLIED)
 
     def draw_thermometer_display(self):
         """Draws the thermometer visualization and status indicators."""
         panel_rect = self.thermo_panel_rect
-        self._draw_panel(panel_rect, "Live Display")
-        
-        section_width = panel_rect.width / 3
-        thermo_center_x = panel_rect.left + section_width * 0.9
-        current_center_x = panel_rect.left + section_width * 1.3
-        status_center_x = panel_rect.left + section_width * 2.2
+        self.screen.blit(self._thermo_bg_static, panel_rect.topleft)
+        thermo_center_x = self._thermo_center_x
+        status_center_x = self._status_center_x
 
         # --- Thermometer Drawing ---
         thermo_y, bulb_radius, stem_width, stem_height = panel_rect.centery, 25, 30, 75
-        
-        pygame.draw.rect(self.screen, self.COLOR['grid'], (thermo_center_x - stem_width/2, thermo_y - stem_height, stem_width, stem_height), border_radius=15)
-        pygame.draw.circle(self.screen, self.COLOR['grid'], (thermo_center_x, thermo_y), bulb_radius)
 
-        temp_perc = min(1.0, max(0.0, self.current_temp / 50.0))
+        # Temperature clamped to the 0-50°C scale of the thermometer
+        shown_temp = self.current_temp
+        shown_temp = 0.0 if shown_temp < 0.0 else (50.0 if shown_temp > 50.0 else shown_temp)
+        temp_perc = shown_temp / 50.0
         fill_height = temp_perc * (stem_height)
         
-        if self.current_temp < 15: fill_color = (59, 130, 246)
-        elif self.current_temp < 25: fill_color = self.COLOR['accent_green']
-        elif self.current_temp < 35: fill_color = (245, 158, 11)
-        else: fill_color = self.COLOR['accent_red']
+        fill_color = tuple(self._fill_color_lut[int(shown_temp)])
 
-        pygame.draw.circle(self.screen, fill_color, (thermo_center_x, thermo_y), bulb_radius - 5)
+        # One lock for both shapes instead of one per draw call; blits are not
+        # allowed onto a locked surface, so the lock covers only these draws
+        self.screen.lock()
+        pygame.draw.circle(self.screen, fill_color, self._bulb_center, bulb_radius - 5)
         if fill_height > 0:
             pygame.draw.rect(self.screen, fill_color, (thermo_center_x - stem_width/2 + 5, thermo_y - (fill_height - bulb_radius/2), stem_width - 10, fill_height-bulb_radius/2), border_top_left_radius=10, border_top_right_radius=10)
+        self.screen.unlock()
 
         # --- Text Display ---
-        self._render_and_blit_text(f"{self.current_temp:.1f}°C", self.font_big, self.COLOR['text'], (current_center_x, panel_rect.centery - 10), anchor="center")
-        self._render_and_blit_text("Current", self.font_small, self.COLOR['text_light'], (current_center_x, panel_rect.centery + 25), anchor="center")
+        self._blit_digits(f"{self.current_temp:.1f}°C", self.font_big, self.COLOR['text'], (self._current_center_x, panel_rect.centery - 10), anchor="center")
         
         self._render_and_blit_text(f"Target: {self.target_temp:.1f}°C", self.font_medium, self.COLOR['accent_red'], (status_center_x, panel_rect.centery - 60), anchor="center")
 
         # Only show fuzzy control action, not ambient drift
         action_text = self.control_action
-        if action_text == 'COOL': bg_color, text_color = (229, 242, 255), (37, 99, 235)
-        elif action_text == 'HEAT': bg_color, text_color = (254, 226, 226), (220, 38, 38)
-        else: bg_color, text_color = (243, 244, 246), (75, 85, 99)
-        
-        action_rect = pygame.Rect(0, 0, 120, 35)
-        action_rect.center = (status_center_x, panel_rect.centery)
-        pygame.draw.rect(self.screen, bg_color, action_rect, border_radius=15)
-        self._render_and_blit_text(action_text, self.font_small, text_color, action_rect.center, anchor="center")
+        bg_color, text_color = self._ACTION_STYLES.get(action_text, self._ACTION_STYLES['NEUTRAL'])
+        self.screen.blit(self._rounded_rect(self._action_rect.size, bg_color, 15), self._action_rect)
+        self._render_and_blit_text(action_text, self.font_small, text_color, self._action_rect.center, anchor="center")
 
         # Update status text to show ambient drift if applicable
         if self.is_applying_ambient_drift:
             status, status_color = "Passive Drift", self.COLOR['accent_purple']
         else:
-            is_at_target = abs(self.current_temp - self.target_temp) <= 0.4
+            diff = self.current_temp - self.target_temp
+            is_at_target = -0.4 <= diff <= 0.4
             status, status_color = ("✓ At Target", self.COLOR['accent_green']) if is_at_target and self.is_running else ("Adjusting", self.COLOR['accent_orange'])
         
         self._render_and_blit_text(status, self.font_medium, status_color, (status_center_x, panel_rect.centery + 60), anchor="center")
     
+    def _update_button_colors(self, mouse_pos):
+        """Picks the start/pause and reset button colors for the run state and mouse position."""
+        if self.is_running:
+            hovered, idle = self.COLOR['btn_pause_hover'], self.COLOR['btn_pause']
+        else:
+            hovered, idle = self.COLOR['btn_start_hover'], self.COLOR['btn_start']
+        self._sp_color = hovered if self.btn_start_pause_rect.collidepoint(mouse_pos) else idle
+        self._reset_color = self.COLOR['btn_reset_hover'] if self.btn_reset_rect.collidepoint(mouse_pos) else self.COLOR['btn_reset']
+
     def draw_control_panel(self):
         """Draws the control panel with buttons and target temp display."""
         panel_rect = self.control_panel_rect
-        self._draw_panel(panel_rect, "Control Panel")
+        self.screen.blit(self._control_bg, panel_rect.topleft)
 
-        self._render_and_blit_text("Target Temperature (°C)", self.font_small, self.COLOR['text_light'], (panel_rect.x + 30, panel_rect.y + 60))
         self._render_and_blit_text(f"{self.target_temp:.1f}", self.font_medium, self.COLOR['text'], (panel_rect.x + 130, panel_rect.y + 95), anchor="center")
         
-        mouse_pos = pygame.mouse.get_pos()
-        
-        pygame.draw.rect(self.screen, self.COLOR['grid'], self.btn_plus_rect, border_radius=8)
-        self._render_and_blit_text("+", self.font_big, self.COLOR['text'], self.btn_plus_rect.center, anchor="center")
-        pygame.draw.rect(self.screen, self.COLOR['grid'], self.btn_minus_rect, border_radius=8)
-        self._render_and_blit_text("-", self.font_big, self.COLOR['text'], self.btn_minus_rect.center, anchor="center")
-        
-        sp_color = self.COLOR['btn_pause_hover'] if self.btn_start_pause_rect.collidepoint(mouse_pos) and self.is_running else self.COLOR['btn_pause'] if self.is_running else self.COLOR['btn_start_hover'] if self.btn_start_pause_rect.collidepoint(mouse_pos) else self.COLOR['btn_start']
-        pygame.draw.rect(self.screen, sp_color, self.btn_start_pause_rect, border_radius=8)
+        self._draw_buttons()
+
+    def _draw_buttons(self):
+        """Draws the start/pause and reset buttons in their current hover colors."""
+        self.screen.blit(self._rounded_rect(self.btn_start_pause_rect.size, self._sp_color, 8), self.btn_start_pause_rect)
         self._render_and_blit_text("Pause" if self.is_running else "Start", self.font_medium, (255,255,255), self.btn_start_pause_rect.center, anchor="center")
 
-        reset_color = self.COLOR['btn_reset_hover'] if self.btn_reset_rect.collidepoint(mouse_pos) else self.COLOR['btn_reset']
-        pygame.draw.rect(self.screen, reset_color, self.btn_reset_rect, border_radius=8)
+        self.screen.blit(self._rounded_rect(self.btn_reset_rect.size, self._reset_color, 8), self.btn_reset_rect)
         self._render_and_blit_text("Reset", self.font_medium, (255,255,255), self.btn_reset_rect.center, anchor="center")
 
     def draw_ambient_panel(self):
         """Draws the ambient mode selection panel with toggle button."""
-        panel_rect = self.ambient_panel_rect
-        self._draw_panel(panel_rect, "")
-        pygame.draw.rect(self.screen, self.COLOR['grid'], self.btn_ambient_toggle_rect, border_radius=8)
+        self.screen.blit(self._ambient_bg, self.ambient_panel_rect.topleft)
         self._render_and_blit_text(f"Mode: {self.ambient_mode}", self.font_small, self.COLOR['text'], self.btn_ambient_toggle_rect.center, anchor="center")
 
     def draw_metrics_panel(self):
         """Draws the panel displaying system metrics."""
         panel_rect = self.metrics_panel_rect
-        self._draw_panel(panel_rect, "System Metrics")
+        self.screen.blit(self._metrics_bg, panel_rect.topleft)
         
+        palette = self.COLOR
+
         # Add ambient drift indicator to metrics
         drift_status = "Yes" if self.is_applying_ambient_drift else "No"
-        drift_color = self.COLOR['accent_purple'] if self.is_applying_ambient_drift else self.COLOR['text_light']
+        drift_color = palette['accent_purple'] if self.is_applying_ambient_drift else palette['text_light']
         
+        # Values for the rows labelled by _METRIC_LABELS
         metrics = [
-            ("Error:", f"{self.error:.1f}°C", self.COLOR['accent_blue']),
-            ("Error Rate:", f"{self.error_dot:.3f}°C/s", self.COLOR['accent_purple']),
-            ("Action Strength:", f"{self.action_strength:.3f}", self.COLOR['accent_orange']),
-            ("Runtime:", f"{self.time_step * 0.5:.1f}s", self.COLOR['accent_green'])
+            (f"{self.error:.1f}°C", palette['accent_blue']),
+            (f"{self.error_dot:.3f}°C/s", palette['accent_purple']),
+            (f"{self.action_strength:.3f}", palette['accent_orange']),
+            (f"{self.time_step * 0.5:.1f}s", palette['accent_green'])
         ]
         
-        for i, (label, value, color) in enumerate(metrics):
-            item_rect = pygame.Rect(panel_rect.x + 20, panel_rect.y + 70 + i * 40, panel_rect.width - 40, 35)
-            pygame.draw.rect(self.screen, self.COLOR['bg'], item_rect, border_radius=8)
-            self._render_and_blit_text(label, self.font_small, self.COLOR['text'], (item_rect.left + 15, item_rect.centery), anchor="midleft")
-            self._render_and_blit_text(value, self.font_mono, color, (item_rect.right - 15, item_rect.centery), anchor="midright")
+        for item_rect, (value, color) in zip(self._metric_item_rects, metrics):
+            self._blit_digits(value, self.font_mono, color, (item_rect.right - 15, item_rect.centery), anchor="midright")
 
     def process_events(self):
         """Handles all user input events."""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False 
+            if event.type == pygame.MOUSEMOTION:
+                colors = (self._sp_color, self._reset_color)
+                self._update_button_colors(event.pos)
+                self._hover_dirty |= colors != (self._sp_color, self._reset_color)
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._needs_redraw = True
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                self._needs_redraw = True
                 if self.btn_start_pause_rect.collidepoint(event.pos):
                     self.is_running = not self.is_running
                     if self.is_running:
@@ -402,6 +631,7 @@ class FuzzyThermalControl:
                         self.ambient_mode, self.ambient_temp = 'Winter', 10.0
                     else:
                         self.ambient_mode, self.ambient_temp = 'Summer', 30.0
+                self._update_button_colors(event.pos)
         return True
 
     def run(self):
@@ -416,16 +646,26 @@ class FuzzyThermalControl:
                     self.update_simulation()
                     self.last_update_time = current_time
 
-            self.screen.fill(self.COLOR['bg'])
-            self._render_and_blit_text("Fuzzy Logic Thermal Control System", self.font_big, self.COLOR['text'], (self.WIDTH / 2, 40), anchor="center")
-            
-            self.draw_graph()
-            self.draw_thermometer_display()
-            self.draw_control_panel()
-            self.draw_ambient_panel()
-            self.draw_metrics_panel()
-
-            pygame.display.flip()
+            if self._needs_redraw:
+                self.screen.fill(self.COLOR['bg'])
+                self._render_and_blit_text("Fuzzy Logic Thermal Control System", self.font_big, self.COLOR['text'], (self.WIDTH / 2, 40), anchor="center")
+
+                self.draw_graph()
+                self.draw_thermometer_display()
+                self.draw_control_panel()
+                self.draw_ambient_panel()
+                self.draw_metrics_panel()
+                self._flush_blits()
+
+                pygame.display.flip()
+                self._needs_redraw = False
+            elif self._hover_dirty:
+                # Only a hover color changed: repaint just the two buttons. The
+                # SCALED renderer always presents the whole frame, so flip.
+                self._draw_buttons()
+                self._flush_blits()
+                pygame.display.flip()
+            self._hover_dirty = False
             self.clock.tick(60)
 
         pygame.quit()